@@ -1,17 +1,173 @@
 """
 Module for handling API calls to the [AlgoBulls](https://www.algobulls.com) backend.
 """
+import asyncio
+import copy
+import functools
+import hashlib
 import json
+import logging
+import math
+import os
 import re
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as dt, timezone
-from json import JSONDecodeError
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .exceptions import AlgoBullsAPIBaseException, AlgoBullsAPIUnauthorizedErrorException, AlgoBullsAPIInsufficientBalanceErrorException, AlgoBullsAPIResourceNotFoundErrorException, AlgoBullsAPIBadRequestException, \
     AlgoBullsAPIInternalServerErrorException, AlgoBullsAPIForbiddenErrorException, AlgoBullsAPIGatewayTimeoutErrorException
 from ..constants import TradingType, TradingReportType
-from ..utils.func import get_raw_response
+from ..utils.func import import_with_install
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard library
+    orjson = None
+
+JSONDecodeError = (orjson.JSONDecodeError, ValueError) if orjson is not None else ValueError
+_LONG_DIGITS = re.compile(rb'\d{19,}')
+
+# Endpoints, relative to `AlgoBullsAPI.SERVER_ENDPOINT`
+_EP_PORTFOLIO_STRATEGY = 'v2/portfolio/strategy'
+_EP_STRATEGY_STATUS = 'v2/user/strategy/status'
+_EP_STRATEGY_CODE = 'v3/build/python/user/strategy/code'
+_EP_DELETE_TRADES = 'v3/build/python/user/strategy/deleteAll?strategyId='
+_EP_SEARCH_INSTRUMENT = 'v4/portfolio/searchInstrument'
+_EP_TWEAK = 'v4/portfolio/tweak/'
+_EP_LOGS = 'v4/user/strategy/logs'
+_EP_PL = 'v4/book/pl/data'
+_EP_STRATEGIES = 'v5/portfolio/strategies'
+_EP_ORDER = 'v5/build/python/user/order/charts'
+
+# Exception raised for each known non-200 status code
+_EXC_MAP = {
+    400: AlgoBullsAPIBadRequestException,
+    401: AlgoBullsAPIUnauthorizedErrorException,
+    402: AlgoBullsAPIInsufficientBalanceErrorException,
+    403: AlgoBullsAPIForbiddenErrorException,
+    404: AlgoBullsAPIResourceNotFoundErrorException,
+    500: AlgoBullsAPIInternalServerErrorException,
+    504: AlgoBullsAPIGatewayTimeoutErrorException
+}
+
+# Errors for which a strategy key loaded from the on-disk cache is considered stale
+_STALE_KEY_ERRORS = (AlgoBullsAPIUnauthorizedErrorException, AlgoBullsAPIResourceNotFoundErrorException)
+
+# Retry policy for transient gateway errors, shared by the `requests` and `httpx` backends.
+# Like urllib3's default, only idempotent methods are retried; the delays match its exponential backoff for `_RETRY_BACKOFF_FACTOR`.
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF_FACTOR = 0.2
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_RETRY_METHODS = frozenset({'DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT', 'TRACE'})
+_RETRY_DELAYS = tuple(_RETRY_BACKOFF_FACTOR * 2 ** n if n else 0 for n in range(_RETRY_TOTAL))
+
+# Query params for the logs API only depend on the trading type
+_LOGS_PARAMS = {trading_type: {'isPythonBuild': True, 'isLive': trading_type is TradingType.REALTRADING} for trading_type in TradingType}
+
+# Key under which the start & end timestamps are sent for each trading type
+_DATE_KEY = {
+    TradingType.REALTRADING: 'liveDataTime',
+    TradingType.PAPERTRADING: 'backDataTime',
+    TradingType.BACKTESTING: 'backDataDate'
+}
+
+
+def _raise_for(r, method, url, status_code, raise_unknown):
+    # The body has already been read by `requests`, so the cached content is used instead of the raw stream
+    exc_cls = _EXC_MAP.get(status_code, AlgoBullsAPIBaseException if raise_unknown else None)
+    if exc_cls is None:
+        return
+    try:
+        response = _json_loads(r.content)
+    except JSONDecodeError:
+        # Error pages from the gateway (e.g. 500/504) may be HTML or empty
+        response = r.text
+    raise exc_cls(method=method, url=url, response=response, status_code=status_code)
+
+
+def _handle_response(r, method, url, raise_unknown=True, return_response=False):
+    sc = r.status_code
+    if sc == 200:
+        try:
+            r_json = _json_loads(r.content)
+        except JSONDecodeError:
+            r_json = {'response': r.text}
+    elif sc == 304 and return_response:
+        # Only conditional requests (which also ask for the raw response) expect a 304, so the caller can reuse what it already has
+        r_json = None
+    else:
+        _raise_for(r, method=method, url=url, status_code=sc, raise_unknown=raise_unknown)
+        r_json = _json_loads(r.content)
+
+    return (r, r_json) if return_response else r_json
+
+
+@functools.lru_cache(maxsize=None)
+def _field_pattern(field: str):
+    # Matches `"<field>": "<value>"` as the first member of the top-level object, for string values without escape sequences
+    return re.compile(rb'\A\s*\{\s*"' + re.escape(field.encode()) + rb'"\s*:\s*"([^"\\]*)"\s*[,}]')
+
+
+def _httpx_params(params):
+    # Keep the query string identical to the one sent by `requests`, which encodes booleans as 'True' / 'False'
+    if not isinstance(params, dict):
+        return params
+    return {k: str(v) if isinstance(v, bool) else v for k, v in params.items()}
+
+
+def _new_httpx_client(async_client=False):
+    httpx = import_with_install(package_import_name='httpx', package_install_name='httpx[http2]')
+    # httpx may already be installed without its HTTP/2 extra
+    import_with_install(package_import_name='h2')
+    client_cls, transport_cls = (httpx.AsyncClient, httpx.AsyncHTTPTransport) if async_client else (httpx.Client, httpx.HTTPTransport)
+    # The transport retries failed connections only; retrying on `_RETRY_STATUSES` is done by the callers
+    transport = transport_cls(http2=True, retries=_RETRY_TOTAL, limits=httpx.Limits(max_connections=4, max_keepalive_connections=4))
+    return client_cls(base_url=AlgoBullsAPI.SERVER_ENDPOINT, transport=transport)
+
+
+def _should_retry(method, r):
+    return r.status_code in _RETRY_STATUSES and method.upper() in _RETRY_METHODS
+
+
+def _merge_report_pages(responses):
+    data = []
+    for response in responses:
+        data.extend(response.get('data') or [])
+    return data
+
+
+@functools.lru_cache(maxsize=32)
+def _build_start_endpoint(is_live: bool, location: str) -> str:
+    return f'{_EP_STRATEGIES}?isPythonBuild=true&isLive={"true" if is_live else "false"}&location={location}'
+
+
+@functools.lru_cache(maxsize=256)
+def _iso_utc_naive(d: dt) -> str:
+    # The same start/end timestamps are usually submitted for several strategies
+    return d.astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _json_loads(content: bytes):
+    # Parse the raw response bytes directly, skipping the text decode done by `requests`
+    # orjson turns integers wider than 64 bits into floats, so such payloads are left to the standard library
+    if orjson is not None and _LONG_DIGITS.search(content) is None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the standard library (e.g. NaN, Infinity), so retry before giving up
+            pass
+    return json.loads(content)
+
+
+def _json_dumps(obj) -> str:
+    return orjson.dumps(obj).decode() if orjson is not None else json.dumps(obj)
 
 
 class AlgoBullsAPI:
@@ -19,22 +175,66 @@ class AlgoBullsAPI:
     AlgoBulls API
     """
     SERVER_ENDPOINT = 'https://api.algobulls.com/'
+    STRATEGY_KEY_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.algobulls', 'keycache.json')
+    STRATEGY_KEY_CACHE_TTL = 30 * 24 * 60 * 60  # seconds
 
-    def __init__(self, connection):
+    def __init__(self, connection, min_poll_interval: float = 2, http2: bool = False, strategy_key_cache_path: str = STRATEGY_KEY_CACHE_PATH):
         """
         Init method that is used while creating an object of this class
+
+        Args:
+            connection: connection object using this API
+            min_poll_interval: seconds within which repeated job status calls for the same strategy are answered from the last fetched status
+            http2: If True, requests are sent over HTTP/2 using `httpx`, multiplexing concurrent requests on a single connection
+            strategy_key_cache_path: file in which strategy keys are persisted across sessions; None to disable persisting them
         """
         self.connection = connection
+        self.verbose = connection.verbose if hasattr(connection, 'verbose') else False
+        self._log = logging.getLogger(__name__)
+        self.min_poll_interval = min_poll_interval
+        self._last_status = {}  # (trading type, strategy) -> (etag, response, fetch time)
+        self.all_strategies_cache_ttl = 60  # seconds
+        self._all_strategies = None  # (response, expiry time)
+        self.strategy_details_cache_size = 256
+        self._strategy_details = OrderedDict()  # strategy-details mapping, least recently used first
         self.headers = None
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=_RETRY_TOTAL, backoff_factor=_RETRY_BACKOFF_FACTOR, status_forcelist=_RETRY_STATUSES, raise_on_status=False)))
+        self._client = _new_httpx_client() if http2 else None
         self.page_size = 1000
+        self.gateway_timeout_attempts = 5  # attempts per page of a paginated report, when the gateway times out
+        self.gateway_timeout_retry_delay = 5  # seconds
+        self._executor = ThreadPoolExecutor(max_workers=8)
         self.__key_backtesting = {}  # strategy-cstc_id mapping
         self.__key_papertrading = {}  # strategy-cstc_id mapping
         self.__key_realtrading = {}  # strategy-cstc_id mapping
+        self._tt_method = {
+            TradingType.REALTRADING: 'post',
+            TradingType.PAPERTRADING: 'put',
+            TradingType.BACKTESTING: 'patch'
+        }
+        self._tt_cache = {
+            TradingType.REALTRADING: self.__key_realtrading,
+            TradingType.PAPERTRADING: self.__key_papertrading,
+            TradingType.BACKTESTING: self.__key_backtesting
+        }
         self.pattern = re.compile(r'(?<!^)(?=[A-Z])')
+        self._key_cache = {}  # camelcase-snakecase mapping
+        self.strategy_key_cache_path = strategy_key_cache_path
+        self._strategy_key_store = None  # access token hash -> trading type name -> strategy -> {key, ts}; read on the first `set_access_token()`
+        self._strategy_key_namespace = None
+        self._persisted_keys = set()  # (trading_type, strategy_code) pairs whose key was loaded from disk
+
+    def _to_snake(self, k):
+        # API keys come from a small fixed vocabulary, so each one is converted only once
+        v = self._key_cache.get(k)
+        if v is None:
+            v = self._key_cache[k] = self.pattern.sub('_', k).lower()
+        return v
 
     def __convert(self, _dict):
         # Helps convert _dict keys from camelcase to snakecase
-        return {self.pattern.sub('_', k).lower(): v for k, v in _dict.items()}
+        return {self._to_snake(k): v for k, v in _dict.items()}
 
     def set_access_token(self, access_token: str):
         """
@@ -48,9 +248,47 @@ class AlgoBullsAPI:
         self.headers = {
             'Authorization': f'{access_token}'
         }
+        self.session.headers.update(self.headers)
+        self._invalidate_strategy_caches()
+        self._last_status.clear()
+
+        # Keys are only valid for the user they were generated for, hence the cache is namespaced by the access token
+        self._strategy_key_namespace = hashlib.sha256(access_token.encode()).hexdigest()[:16]
+        self._persisted_keys.clear()
+        if self._strategy_key_store is None:
+            self._strategy_key_store = self.__load_strategy_key_store()
+        now = time.time()
+        namespace = self._strategy_key_store.get(self._strategy_key_namespace, {})
+        for trading_type, cache in self._tt_cache.items():
+            cache.clear()
+            for strategy_code, entry in namespace.get(trading_type.name, {}).items():
+                if now - entry.get('ts', 0) < self.STRATEGY_KEY_CACHE_TTL:
+                    cache[strategy_code] = entry.get('key')
+                    self._persisted_keys.add((trading_type, strategy_code))
+
+    def _report(self, msg, end='\n', level=logging.DEBUG):
+        # Progress messages go to stdout only in verbose mode, otherwise to the module logger
+        if self.verbose:
+            print(msg, end=end)
+        else:
+            self._log.log(level, msg)
+
+    def _invalidate_strategy_caches(self):
+        self._all_strategies = None
+        self._strategy_details.clear()
+
+    def close(self):
+        """
+        Close the underlying HTTP session and release its pooled connections
+        """
+
+        self._executor.shutdown(wait=False)
+        self.session.close()
+        if self._client is not None:
+            self._client.close()
 
     def _send_request(self, method: str = 'get', endpoint: str = '', base_url: str = SERVER_ENDPOINT, params: [str, dict] = None, json_data: [str, dict] = None, requires_authorization: bool = True,
-                      raise_exception_unknown_status_code: bool = True) -> dict:
+                      raise_exception_unknown_status_code: bool = True, headers: dict = None, return_response: bool = False) -> dict:
         """
         Send the request to the platform
         
@@ -61,49 +299,97 @@ class AlgoBullsAPI:
             params: parameters
             json_data: json data as body
             requires_authorization: True or False
+            raise_exception_unknown_status_code: True or False
+            headers: additional headers for this request only
+            return_response: If True, the raw response object is returned along with the parsed JSON
 
         Returns:
-            request status
+            request status; None if `return_response` is set and the server replied with 304 (Not Modified)
         """
 
-        url = f'{base_url}{endpoint}'
-        headers = self.headers if requires_authorization else None
-        r = requests.request(method=method, headers=headers, url=url, params=params, json=json_data)
+        url = base_url + endpoint
+        r = self._request(method=method, url=url, params=params, json_data=json_data, requires_authorization=requires_authorization, headers=headers)
+
+        return _handle_response(r, method=method, url=url, raise_unknown=raise_exception_unknown_status_code, return_response=return_response)
+
+    def _request(self, method, url, params=None, json_data=None, requires_authorization=True, headers=None):
+        # Send the request over the active backend and return the raw response object
+        if self._client is not None:
+            request_headers = dict(self.headers) if requires_authorization and self.headers else {}
+            request_headers.update(headers or {})
+            # httpx has no status based retries, so the policy of the `requests` session is applied here
+            r = self._client.request(method=method, url=url, headers=request_headers, params=_httpx_params(params), json=json_data)
+            for delay in _RETRY_DELAYS:
+                if not _should_retry(method, r):
+                    break
+                time.sleep(delay)
+                r = self._client.request(method=method, url=url, headers=request_headers, params=_httpx_params(params), json=json_data)
+            return r
+
+        # Authorization is attached through the session headers; a None value drops it for this request only
+        headers = dict(headers) if headers else {}
+        if not requires_authorization:
+            headers['Authorization'] = None
+        return self.session.request(method=method, headers=headers or None, url=url, params=params, json=json_data)
+
+    def _send_request_field(self, field: str, method: str = 'get', endpoint: str = '', base_url: str = SERVER_ENDPOINT, params: [str, dict] = None, json_data: [str, dict] = None):
+        """
+        Send the request to the platform and return a single top-level string field of the response, without parsing the whole response when possible
+
+        Args:
+            field: name of the field to be returned
+            method: get
+            endpoint: endpoint url
+            base_url: base url
+            params: parameters
+            json_data: json data as body
+
+        Returns:
+            value of the field
+        """
+
+        url = base_url + endpoint
+        r = self._request(method=method, url=url, params=params, json_data=json_data)
 
         if r.status_code == 200:
-            try:
-                r_json = r.json()
-                return r_json
-            except JSONDecodeError:
-                r.raw.decode_content = True
-                return {'response': get_raw_response(r)}
-        elif r.status_code == 400:
-            r.raw.decode_content = True
-            raise AlgoBullsAPIBadRequestException(method=method, url=url, response=get_raw_response(r), status_code=400)
-        elif r.status_code == 401:
-            r.raw.decode_content = True
-            raise AlgoBullsAPIUnauthorizedErrorException(method=method, url=url, response=get_raw_response(r), status_code=401)
-        elif r.status_code == 402:
-            r.raw.decode_content = True
-            raise AlgoBullsAPIInsufficientBalanceErrorException(method=method, url=url, response=get_raw_response(r), status_code=402)
-        elif r.status_code == 403:
-            r.raw.decode_content = True
-            raise AlgoBullsAPIForbiddenErrorException(method=method, url=url, response=get_raw_response(r), status_code=403)
-        elif r.status_code == 404:
-            r.raw.decode_content = True
-            raise AlgoBullsAPIResourceNotFoundErrorException(method=method, url=url, response=get_raw_response(r), status_code=404)
-        elif r.status_code == 500:
-            r.raw.decode_content = True
-            raise AlgoBullsAPIInternalServerErrorException(method=method, url=url, response=get_raw_response(r), status_code=500)
-        elif r.status_code == 504:
+            # The scan is only trusted when the field is the first top-level member and its name occurs nowhere else (e.g. as a nested or duplicate key)
+            match = _field_pattern(field).match(r.content)
+            if match is not None and r.content.count(b'"' + field.encode() + b'"') == 1:
+                return match.group(1).decode()
+
+        response = _handle_response(r, method=method, url=url)
+        return response.get(field) if isinstance(response, dict) else None
+
+    def _send_request_streaming(self, method: str = 'get', endpoint: str = '', base_url: str = SERVER_ENDPOINT, params: [str, dict] = None, json_data: [str, dict] = None, prefix: str = 'data.item'):
+        """
+        Send the request to the platform and parse the response incrementally as it is received.
+        This always goes through the `requests` session, also when the HTTP/2 backend is enabled.
+
+        Args:
+            method: get
+            endpoint: endpoint url
+            base_url: base url
+            params: parameters
+            json_data: json data as body
+            prefix: ijson path of the items to be yielded from the response
+
+        Yields:
+            items found under `prefix` in the response
+        """
+
+        ijson = import_with_install(package_import_name='ijson')
+
+        url = base_url + endpoint
+        r = self.session.request(method=method, url=url, params=params, json=json_data, stream=True)
+        try:
+            sc = r.status_code
+            if sc != 200:
+                _raise_for(r, method=method, url=url, status_code=sc, raise_unknown=True)
+
             r.raw.decode_content = True
-            raise AlgoBullsAPIGatewayTimeoutErrorException(method=method, url=url, response=get_raw_response(r), status_code=504)
-        else:
-            if raise_exception_unknown_status_code:
-                r.raw.decode_content = True
-                raise AlgoBullsAPIBaseException(method=method, url=url, response=get_raw_response(r), status_code=r.status_code)
-            else:
-                return r.json()
+            yield from ijson.items(r.raw, prefix, use_float=True)
+        finally:
+            r.close()
 
     def __fetch_key(self, strategy_code, trading_type):
         """
@@ -122,40 +408,117 @@ class AlgoBullsAPI:
             `PATCH` v2/portfolio/strategy
         """
 
-        endpoint = f'v2/portfolio/strategy'
+        endpoint = _EP_PORTFOLIO_STRATEGY
         json_data = {'strategyId': strategy_code, 'tradingType': trading_type.value}
 
         # This api fails for some weird reason
         # response = self._send_request(method='options', endpoint=endpoint, json_data=json_data)
 
-        if trading_type is TradingType.REALTRADING:
-            response = self._send_request(method='post', endpoint=endpoint, json_data=json_data)
-        elif trading_type is TradingType.PAPERTRADING:
-            response = self._send_request(method='put', endpoint=endpoint, json_data=json_data)
-        elif trading_type is TradingType.BACKTESTING:
-            response = self._send_request(method='patch', endpoint=endpoint, json_data=json_data)
-        else:
-            raise NotImplementedError
-
-        key = response.get('key')
+        method = self._tt_method[trading_type]
+        key = self._send_request_field('key', method=method, endpoint=endpoint, json_data=json_data)
 
         return key
 
+    def __load_strategy_key_store(self):
+        if self.strategy_key_cache_path is None:
+            return {}
+        try:
+            with open(self.strategy_key_cache_path, 'rb') as f:
+                store = _json_loads(f.read())
+            return store if isinstance(store, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def __save_strategy_key_store(self):
+        if self.strategy_key_cache_path is None or self._strategy_key_store is None:
+            return
+        # Write to a temporary file first and swap it in, so that a crash never leaves a truncated cache behind
+        tmp_path = None
+        try:
+            directory = os.path.dirname(self.strategy_key_cache_path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                f.write(_json_dumps(self._strategy_key_store))
+            os.replace(tmp_path, self.strategy_key_cache_path)
+        except OSError:
+            # Persisting keys is an optimisation only; the in-memory cache keeps working regardless
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def __store_key(self, strategy_code, trading_type, key, save=True):
+        if self._strategy_key_namespace is None or key is None:
+            return
+        namespace = self._strategy_key_store.setdefault(self._strategy_key_namespace, {})
+        namespace.setdefault(trading_type.name, {})[strategy_code] = {'key': key, 'ts': time.time()}
+        if save:
+            self.__save_strategy_key_store()
+
+    def _evict_stale_key(self, strategy_code, trading_type):
+        # Called when the platform rejects a key; only keys loaded from the on-disk cache may be stale, so only those are evicted.
+        # Returns True if the key was evicted and the request should be retried with a freshly fetched key.
+        if (trading_type, strategy_code) not in self._persisted_keys:
+            return False
+        self._tt_cache[trading_type].pop(strategy_code, None)
+        self._persisted_keys.discard((trading_type, strategy_code))
+        namespace = self._strategy_key_store.get(self._strategy_key_namespace, {})
+        if namespace.get(trading_type.name, {}).pop(strategy_code, None) is not None:
+            self.__save_strategy_key_store()
+        return True
+
     def __get_key(self, strategy_code, trading_type):
-        if trading_type is TradingType.BACKTESTING:
-            if self.__key_backtesting.get(strategy_code) is None:
-                self.__key_backtesting[strategy_code] = self.__fetch_key(strategy_code=strategy_code, trading_type=TradingType.BACKTESTING)
-            return self.__key_backtesting[strategy_code]
-        elif trading_type is TradingType.PAPERTRADING:
-            if self.__key_papertrading.get(strategy_code) is None:
-                self.__key_papertrading[strategy_code] = self.__fetch_key(strategy_code=strategy_code, trading_type=TradingType.PAPERTRADING)
-            return self.__key_papertrading[strategy_code]
-        elif trading_type is TradingType.REALTRADING:
-            if self.__key_realtrading.get(strategy_code) is None:
-                self.__key_realtrading[strategy_code] = self.__fetch_key(strategy_code=strategy_code, trading_type=TradingType.REALTRADING)
-            return self.__key_realtrading[strategy_code]
-        else:
-            raise NotImplementedError
+        cache = self._tt_cache[trading_type]
+        key = cache.get(strategy_code)
+        if key is None:
+            key = cache[strategy_code] = self.__fetch_key(strategy_code=strategy_code, trading_type=trading_type)
+            self.__store_key(strategy_code=strategy_code, trading_type=trading_type, key=key)
+        return key
+
+    def prefetch_keys(self, strategy_codes: list, trading_type: TradingType):
+        """
+        Fetch the keys of multiple strategies concurrently, so that subsequent calls for these strategies do not fetch them one at a time
+
+        Args:
+            strategy_codes: list of strategy codes
+            trading_type: trading type
+        """
+
+        cache = self._tt_cache[trading_type]
+        missing = [strategy_code for strategy_code in dict.fromkeys(strategy_codes) if strategy_code not in cache]
+        if not missing:
+            return
+
+        keys = self._executor.map(lambda _strategy_code: self.__fetch_key(strategy_code=_strategy_code, trading_type=trading_type), missing)
+        try:
+            for strategy_code, key in zip(missing, keys):
+                cache[strategy_code] = key
+                self.__store_key(strategy_code=strategy_code, trading_type=trading_type, key=key, save=False)
+        finally:
+            # Keys fetched before a failing one are still persisted
+            self.__save_strategy_key_store()
+
+    def __send_request_with_key(self, strategy_code, trading_type, build_request):
+        """
+        Send a request that depends on the strategy key.
+        If a key loaded from the on-disk cache is rejected by the platform, it is evicted and the request is retried once with a freshly fetched key.
+
+        Args:
+            strategy_code: strategy code
+            trading_type: trading type
+            build_request: callable taking the key and returning the keyword arguments for `_send_request`
+
+        Returns:
+            key, response
+        """
+
+        key = self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
+        try:
+            return key, self._send_request(**build_request(key))
+        except _STALE_KEY_ERRORS:
+            if not self._evict_stale_key(strategy_code=strategy_code, trading_type=trading_type):
+                raise
+            key = self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
+            return key, self._send_request(**build_request(key))
 
     def create_strategy(self, strategy_name: str, strategy_details: str, abc_version: str) -> dict:
         """
@@ -178,14 +541,15 @@ class AlgoBullsAPI:
 
         try:
             json_data = {'strategyName': strategy_name, 'strategyDetails': strategy_details, 'abcVersion': abc_version}
-            endpoint = f'v3/build/python/user/strategy/code'
-            print(f"Uploading strategy '{strategy_name}' ...", end=' ')
+            endpoint = _EP_STRATEGY_CODE
+            self._report(f"Uploading strategy '{strategy_name}' ...", end=' ')
             response = self._send_request(endpoint=endpoint, method='post', json_data=json_data)
-            print('Success.')
+            self._invalidate_strategy_caches()
+            self._report('Success.')
             return response
         except (AlgoBullsAPIForbiddenErrorException, AlgoBullsAPIInsufficientBalanceErrorException) as ex:
-            print('Fail.')
-            print(f'{ex.get_error_type()}: {ex.response}')
+            self._report('Fail.')
+            self._report(f'{ex.get_error_type()}: {ex.response}', level=logging.ERROR)
 
     def update_strategy(self, strategy_code: str, strategy_name: str, strategy_details: str, abc_version: str) -> dict:
         """
@@ -205,46 +569,76 @@ class AlgoBullsAPI:
         """
 
         json_data = {'strategyId': strategy_code, 'strategyName': strategy_name, 'strategyDetails': strategy_details, 'abcVersion': abc_version}
-        endpoint = f'v3/build/python/user/strategy/code'
+        endpoint = _EP_STRATEGY_CODE
         response = self._send_request(endpoint=endpoint, method='put', json_data=json_data)
+        self._invalidate_strategy_caches()
 
         return response
 
-    def get_all_strategies(self) -> dict:
+    def get_all_strategies(self, refresh: bool = False) -> dict:
         """
         Get all the Python strategies created by the user on the AlgoBulls platform
 
+        Args:
+            refresh: If True, the strategies are fetched from the platform even if a cached response is available
+
         Returns:
             JSON Response received from AlgoBulls platform with list of all the created strategies.
 
+        Note:
+            The response is cached for `all_strategies_cache_ttl` seconds. A copy is returned, so it is safe to modify.
+
         Info: ENDPOINT
             `OPTIONS` v3/build/python/user/strategy/code
         """
 
-        endpoint = f'v3/build/python/user/strategy/code'
+        if not refresh and self._all_strategies is not None and time.monotonic() < self._all_strategies[1]:
+            return copy.deepcopy(self._all_strategies[0])
+
+        endpoint = _EP_STRATEGY_CODE
         response = self._send_request(endpoint=endpoint, method='options')
+        self._all_strategies = (response, time.monotonic() + self.all_strategies_cache_ttl)
+
+        return copy.deepcopy(response)
+
+    def _fetch_strategy_details(self, strategy_code: str) -> dict:
+        params = {}
+        endpoint = f'{_EP_STRATEGY_CODE}/{strategy_code}'
+        response = self._send_request(endpoint=endpoint, params=params)
 
         return response
 
-    def get_strategy_details(self, strategy_code: str) -> dict:
+    def get_strategy_details(self, strategy_code: str, refresh: bool = False) -> dict:
         """
         Get strategy details for a particular strategy
 
         Args:
             strategy_code: unique code of strategy, which is received while creating the strategy or
+            refresh: If True, the details are fetched from the platform even if a cached response is available
 
         Returns:
             JSON
+
+        Note:
+            The response is cached per strategy (for the `strategy_details_cache_size` most recently used ones) until a strategy is created, updated or its trades are deleted.
+            A copy is returned, so it is safe to modify.
             
         Info: ENDPOINT
             `GET` v3/build/python/user/strategy/code/{strategy_code}
         """
 
-        params = {}
-        endpoint = f'v3/build/python/user/strategy/code/{strategy_code}'
-        response = self._send_request(endpoint=endpoint, params=params)
+        if refresh:
+            self._strategy_details.pop(strategy_code, None)
 
-        return response
+        response = self._strategy_details.get(strategy_code)
+        if response is None:
+            response = self._strategy_details[strategy_code] = self._fetch_strategy_details(strategy_code)
+            if len(self._strategy_details) > self.strategy_details_cache_size:
+                self._strategy_details.popitem(last=False)
+        else:
+            self._strategy_details.move_to_end(strategy_code)
+
+        return copy.deepcopy(response)
 
     def search_instrument(self, tradingsymbol: str, exchange: str) -> dict:
         """
@@ -262,7 +656,7 @@ class AlgoBullsAPI:
         """
 
         params = {'search': tradingsymbol, 'exchange': exchange}
-        endpoint = f'v4/portfolio/searchInstrument'
+        endpoint = _EP_SEARCH_INSTRUMENT
         response = self._send_request(endpoint=endpoint, params=params, requires_authorization=False)
 
         return response
@@ -281,8 +675,9 @@ class AlgoBullsAPI:
            `DELETE` v3/build/python/user/strategy/deleteAll?strategyId={strategy}
         """
 
-        endpoint = f'v3/build/python/user/strategy/deleteAll?strategyId={strategy}'
+        endpoint = f'{_EP_DELETE_TRADES}{strategy}'
         response = self._send_request(method='delete', endpoint=endpoint)
+        self._invalidate_strategy_caches()
 
         return response
 
@@ -297,16 +692,18 @@ class AlgoBullsAPI:
 
         Returns:
 
+        Tip:
+            When configuring multiple strategies, call `prefetch_keys()` first to fetch all their keys in one concurrent burst.
+
         Info: ENDPOINT
            `POST` v4/portfolio/tweak/{key}/?isPythonBuild=true
         """
 
         # Configure the params
-        key = self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
-        endpoint = f'v4/portfolio/tweak/{key}?isPythonBuild=true'
-        print('Setting Strategy Config...', end=' ')
-        response = self._send_request(method='post', endpoint=endpoint, json_data=strategy_config)
-        print('Success.')
+        self._report('Setting Strategy Config...', end=' ')
+        key, response = self.__send_request_with_key(strategy_code=strategy_code, trading_type=trading_type,
+                                                     build_request=lambda _key: {'method': 'post', 'endpoint': f'{_EP_TWEAK}{_key}?isPythonBuild=true', 'json_data': strategy_config})
+        self._report('Success.')
 
         return key, response
 
@@ -324,43 +721,39 @@ class AlgoBullsAPI:
             initial_funds_virtual: Virtual funds before starting the strategy
             broker_details: Client's broking details
 
+        Tip:
+            When submitting jobs for multiple strategies, call `prefetch_keys()` first to fetch all their keys in one concurrent burst.
+
         Info: ENDPOINT
             `PATCH` v5/portfolio/strategies?isPythonBuild=true
         """
 
         try:
-            key = self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
-            map_trading_type_to_date_key = {
-                TradingType.REALTRADING: 'liveDataTime',
-                TradingType.PAPERTRADING: 'backDataTime',
-                TradingType.BACKTESTING: 'backDataDate'
-            }
+            is_live = trading_type is TradingType.REALTRADING
             execute_config = {
-                map_trading_type_to_date_key[trading_type]: [start_timestamp.astimezone(timezone.utc).replace(tzinfo=None).isoformat(), end_timestamp.astimezone(timezone.utc).replace(tzinfo=None).isoformat()],
-                'isLiveDataTestMode': trading_type in [TradingType.PAPERTRADING, TradingType.REALTRADING],
+                _DATE_KEY[trading_type]: [_iso_utc_naive(start_timestamp), _iso_utc_naive(end_timestamp)],
+                'isLiveDataTestMode': trading_type is not TradingType.BACKTESTING,
                 'customizationsQuantity': lots,
                 'brokingDetails': broker_details,
                 'mode': trading_type.name
             }
 
             params = None
-            if trading_type in [TradingType.PAPERTRADING, TradingType.BACKTESTING]:
-                endpoint = f'v5/portfolio/strategies?isPythonBuild=true&isLive=false&location={location}'
+            endpoint = _build_start_endpoint(is_live, location)
+            if not is_live:
                 execute_config['initialFundsVirtual'] = initial_funds_virtual
-            elif trading_type is TradingType.REALTRADING:
-                endpoint = f'v5/portfolio/strategies?isPythonBuild=true&isLive=true&location={location}'
-            else:
-                raise NotImplementedError
-            json_data = {'method': 'update', 'newVal': 1, 'key': key, 'record': {'status': 0, 'lots': lots, 'executeConfig': execute_config}, 'dataIndex': 'executeConfig'}
-            print(f'Submitting {trading_type.name} job...', end=' ')
+            self._report(f'Submitting {trading_type.name} job...', end=' ')
+            self._last_status.pop((trading_type, strategy_code), None)  # job status is about to change
 
-            response = self._send_request(method='patch', endpoint=endpoint, json_data=json_data, params=params)
-            print('Success.')
+            _, response = self.__send_request_with_key(strategy_code=strategy_code, trading_type=trading_type,
+                                                       build_request=lambda _key: {'method': 'patch', 'endpoint': endpoint, 'params': params,
+                                                                                   'json_data': {'method': 'update', 'newVal': 1, 'key': _key, 'record': {'status': 0, 'lots': lots, 'executeConfig': execute_config}, 'dataIndex': 'executeConfig'}})
+            self._report('Success.')
 
             return response
         except (AlgoBullsAPIForbiddenErrorException, AlgoBullsAPIInsufficientBalanceErrorException) as ex:
-            print('Fail.')
-            print(f'{ex.get_error_type()}: {ex.response}')
+            self._report('Fail.')
+            self._report(f'{ex.get_error_type()}: {ex.response}', level=logging.ERROR)
 
     def stop_strategy_algotrading(self, strategy_code: str, trading_type: TradingType) -> dict:
         """
@@ -374,18 +767,18 @@ class AlgoBullsAPI:
             `POST` v5/portfolio/strategies
         """
 
-        endpoint = 'v5/portfolio/strategies'
+        endpoint = _EP_STRATEGIES
         try:
-            key = self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
-            json_data = {'method': 'update', 'newVal': 0, 'key': key, 'record': {'status': 2}, 'dataIndex': 'executeConfig'}
-            print(f'Stopping {trading_type.name} job...', end=' ')
-            response = self._send_request(method='patch', endpoint=endpoint, json_data=json_data)
-            print('Success.')
+            self._report(f'Stopping {trading_type.name} job...', end=' ')
+            self._last_status.pop((trading_type, strategy_code), None)  # job status is about to change
+            _, response = self.__send_request_with_key(strategy_code=strategy_code, trading_type=trading_type,
+                                                       build_request=lambda _key: {'method': 'patch', 'endpoint': endpoint, 'json_data': {'method': 'update', 'newVal': 0, 'key': _key, 'record': {'status': 2}, 'dataIndex': 'executeConfig'}})
+            self._report('Success.')
 
             return response
         except (AlgoBullsAPIForbiddenErrorException, AlgoBullsAPIInsufficientBalanceErrorException) as ex:
-            print('Fail.')
-            print(f'{ex.get_error_type()}: {ex.response}')
+            self._report('Fail.')
+            self._report(f'{ex.get_error_type()}: {ex.response}', level=logging.ERROR)
 
     def get_job_status(self, strategy_code: str, trading_type: TradingType) -> dict:
         """
@@ -398,16 +791,47 @@ class AlgoBullsAPI:
         Returns:
             Job status
 
+        Note:
+            Calls made within `min_poll_interval` seconds of the previous one return the last fetched status without contacting the server.
+            Otherwise the status is revalidated with the server using its ETag, so an unchanged status is not transferred again.
+
         Info: ENDPOINT
             `GET` v2/user/strategy/status
         """
 
-        key = self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
-        params = {'key': key}
-        endpoint = f'v2/user/strategy/status'
-        response = self._send_request(endpoint=endpoint, params=params)
+        status_id = (trading_type, strategy_code)
+        cached = self._last_status.get(status_id)
+        if cached is not None and time.monotonic() - cached[2] < self.min_poll_interval:
+            return copy.deepcopy(cached[1])
 
-        return response
+        etag = cached[0] if cached is not None else None
+        headers = {'If-None-Match': etag} if etag else None
+        endpoint = _EP_STRATEGY_STATUS
+        _, (r, response) = self.__send_request_with_key(strategy_code=strategy_code, trading_type=trading_type,
+                                                        build_request=lambda _key: {'endpoint': endpoint, 'params': {'key': _key}, 'headers': headers, 'return_response': True})
+        if response is None:
+            # 304 Not Modified, the status has not changed since it was last fetched
+            response = cached[1]
+        self._last_status[status_id] = (r.headers.get('ETag', etag), response, time.monotonic())
+
+        return copy.deepcopy(response)
+
+    def _logs_json_data(self, key, initial_next_token):
+        return {'key': key, 'nextForwardToken': initial_next_token, 'limit': self.page_size, 'direction': 'forward', 'type': 'userLogs'}
+
+    def _reports_request(self, strategy_code, trading_type, report_type, country, current_page):
+        # Endpoint and query params of the reports API
+        if report_type is TradingReportType.PNL_TABLE:
+            _filter = _json_dumps({"tradingType": trading_type.value})
+            endpoint = _EP_PL
+            params = {'pageSize': 0, 'isPythonBuild': "true", 'strategyId': strategy_code, 'isLive': trading_type is TradingType.REALTRADING, 'country': country, 'filters': _filter}
+        elif report_type is TradingReportType.ORDER_HISTORY:
+            endpoint = _EP_ORDER
+            params = {'strategyId': strategy_code, 'country': country, 'currentPage': current_page, 'pageSize': self.page_size, 'isLive': trading_type is TradingType.REALTRADING}
+        else:
+            raise NotImplementedError
+
+        return endpoint, params
 
     def get_logs(self, strategy_code: str, trading_type: TradingType, initial_next_token: str = None) -> dict:
         """
@@ -425,16 +849,15 @@ class AlgoBullsAPI:
             `POST`: v2/user/strategy/logs
         """
 
-        key = self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
-        endpoint = 'v4/user/strategy/logs'
-        json_data = {'key': key, 'nextForwardToken': initial_next_token, 'limit': self.page_size, 'direction': 'forward', 'type': 'userLogs'}
-        params = {'isPythonBuild': True, 'isLive': trading_type == TradingType.REALTRADING}
+        endpoint = _EP_LOGS
+        params = _LOGS_PARAMS[trading_type]
 
-        response = self._send_request(method='post', endpoint=endpoint, json_data=json_data, params=params)
+        _, response = self.__send_request_with_key(strategy_code=strategy_code, trading_type=trading_type,
+                                                   build_request=lambda _key: {'method': 'post', 'endpoint': endpoint, 'params': params, 'json_data': self._logs_json_data(key=_key, initial_next_token=initial_next_token)})
 
         return response
 
-    def get_reports(self, strategy_code: str, trading_type: TradingType, report_type: TradingReportType, country: str, current_page: int) -> dict:
+    def get_reports(self, strategy_code: str, trading_type: TradingType, report_type: TradingReportType, country: str, current_page: int, stream: bool = False) -> dict:
         """
         Fetch report for a strategy
 
@@ -444,6 +867,7 @@ class AlgoBullsAPI:
             report_type: Value of TradingReportType Enum
             country: Country of the exchange
             current_page: current page of data being retrieved (for order history)
+            stream: If True, the rows of the report are parsed incrementally as they are received and a generator over them is returned, instead of the complete response
         Returns:
             Report data
 
@@ -453,16 +877,240 @@ class AlgoBullsAPI:
         """
 
         key = self.__get_key(strategy_code=strategy_code, trading_type=trading_type)
-        if report_type is TradingReportType.PNL_TABLE:
-            _filter = json.dumps({"tradingType": trading_type.value})
-            endpoint = f'v4/book/pl/data'
-            params = {'pageSize': 0, 'isPythonBuild': "true", 'strategyId': strategy_code, 'isLive': trading_type is TradingType.REALTRADING, 'country': country, 'filters': _filter}
-        elif report_type is TradingReportType.ORDER_HISTORY:
-            endpoint = 'v5/build/python/user/order/charts'
-            params = {'strategyId': strategy_code, 'country': country, 'currentPage': current_page, 'pageSize': self.page_size, 'isLive': trading_type is TradingType.REALTRADING}
-        else:
-            raise NotImplementedError
+        endpoint, params = self._reports_request(strategy_code=strategy_code, trading_type=trading_type, report_type=report_type, country=country, current_page=current_page)
+
+        if stream:
+            return self._send_request_streaming(endpoint=endpoint, params=params)
 
         response = self._send_request(endpoint=endpoint, params=params)
 
         return response
+
+    def get_reports_all(self, strategy_code: str, trading_type: TradingType, report_type: TradingReportType, country: str) -> list:
+        """
+        Fetch the complete report for a strategy, requesting all the pages of the order history concurrently
+
+        Args:
+            strategy_code: Strategy code
+            trading_type: Value of TradingType Enum
+            report_type: Value of TradingReportType Enum
+            country: Country of the exchange
+
+        Returns:
+            Report data of all the pages, merged into a single list
+
+        Note:
+            A page whose request times out at the gateway is retried up to `gateway_timeout_attempts` times, `gateway_timeout_retry_delay` seconds apart.
+        """
+
+        # The first page is fetched synchronously, it also tells how many pages are there in total
+        response = self._get_reports_page(strategy_code=strategy_code, trading_type=trading_type, report_type=report_type, country=country, current_page=1)
+        pages = self._remaining_report_pages(report_type=report_type, first_response=response)
+        responses = self._executor.map(lambda page: self._get_reports_page(strategy_code=strategy_code, trading_type=trading_type, report_type=report_type, country=country, current_page=page), pages)
+
+        return _merge_report_pages([response, *responses])
+
+    def _remaining_report_pages(self, report_type, first_response):
+        # Only the order history is paginated; its first page tells how many pages are there in total
+        if report_type is not TradingReportType.ORDER_HISTORY:
+            return range(0)
+        total_pages = math.ceil((first_response.get('totalTrades') or 0) / self.page_size)
+        return range(2, total_pages + 1)
+
+    def _next_logs_token(self, response):
+        # Token of the page following `response`; None if it is the last page available right now, which a partial page also means
+        logs = response.get('data')
+        next_token = response.get('nextForwardToken')
+        return next_token if logs and next_token and len(logs) >= self.page_size else None
+
+    def _get_reports_page(self, strategy_code, trading_type, report_type, country, current_page):
+        # The gateway times out on large pages every now and then, so each page is retried on its own instead of failing the whole report
+        for attempt in range(1, self.gateway_timeout_attempts + 1):
+            try:
+                return self.get_reports(strategy_code=strategy_code, trading_type=trading_type, report_type=report_type, country=country, current_page=current_page)
+            except AlgoBullsAPIGatewayTimeoutErrorException:
+                if attempt == self.gateway_timeout_attempts:
+                    raise
+                self._report(f'Fetching page {current_page} of the report timed out (attempt {attempt}), retrying...', level=logging.WARNING)
+                time.sleep(self.gateway_timeout_retry_delay)
+
+    def get_logs_all(self, strategy_code: str, trading_type: TradingType, initial_next_token: str = None):
+        """
+        Fetch all the logs available for a strategy, page by page.
+        Pages are chained through `nextForwardToken`, so the next page is requested in the background while the caller processes the current one.
+
+        Args:
+            strategy_code: Strategy code
+            trading_type: Trading type
+            initial_next_token: Token of next logs for v4 logs
+
+        Yields:
+            Execution logs response for every page
+        """
+
+        future = self._executor.submit(self.get_logs, strategy_code=strategy_code, trading_type=trading_type, initial_next_token=initial_next_token)
+        try:
+            while future is not None:
+                response = future.result()
+                if not response.get('data'):
+                    return
+
+                next_token = self._next_logs_token(response)
+                future = None
+                if next_token:
+                    future = self._executor.submit(self.get_logs, strategy_code=strategy_code, trading_type=trading_type, initial_next_token=next_token)
+
+                yield response
+        finally:
+            # The caller may stop iterating early, in which case the prefetched page is not needed anymore
+            if future is not None:
+                future.cancel()
+
+
+class AsyncAlgoBullsAPI:
+    """
+    Asynchronous counterpart of `AlgoBullsAPI` for the paginated logs & reports APIs, sending requests over HTTP/2 using `httpx`.
+    Strategy keys, access token & page size are shared with the wrapped `AlgoBullsAPI` object.
+    """
+
+    def __init__(self, api: AlgoBullsAPI):
+        """
+        Init method that is used while creating an object of this class
+
+        Args:
+            api: `AlgoBullsAPI` object whose access token and strategy keys are used
+        """
+        self.api = api
+        self._client = _new_httpx_client(async_client=True)
+
+    async def close(self):
+        """
+        Close the underlying HTTP/2 client
+        """
+
+        await self._client.aclose()
+
+    async def _send_request(self, method: str = 'get', endpoint: str = '', params: dict = None, json_data: dict = None) -> dict:
+        # Transient gateway errors are retried with the same policy as `AlgoBullsAPI`
+        url = self.api.SERVER_ENDPOINT + endpoint
+        r = await self._client.request(method=method, url=url, headers=self.api.headers, params=_httpx_params(params), json=json_data)
+        for delay in _RETRY_DELAYS:
+            if not _should_retry(method, r):
+                break
+            await asyncio.sleep(delay)
+            r = await self._client.request(method=method, url=url, headers=self.api.headers, params=_httpx_params(params), json=json_data)
+        return _handle_response(r, method=method, url=url)
+
+    async def _get_key(self, strategy_code, trading_type):
+        # Key fetches are rare and cached, so they reuse the blocking implementation off the event loop
+        cache = self.api._tt_cache[trading_type]
+        if strategy_code not in cache:
+            await asyncio.get_running_loop().run_in_executor(None, self.api.prefetch_keys, [strategy_code], trading_type)
+        return cache[strategy_code]
+
+    async def _send_request_with_key(self, strategy_code, trading_type, build_request):
+        # Same as `AlgoBullsAPI.__send_request_with_key`: a rejected key from the on-disk cache is evicted and the request retried once
+        key = await self._get_key(strategy_code=strategy_code, trading_type=trading_type)
+        try:
+            return await self._send_request(**build_request(key))
+        except _STALE_KEY_ERRORS:
+            if not self.api._evict_stale_key(strategy_code=strategy_code, trading_type=trading_type):
+                raise
+            key = await self._get_key(strategy_code=strategy_code, trading_type=trading_type)
+            return await self._send_request(**build_request(key))
+
+    async def get_logs(self, strategy_code: str, trading_type: TradingType, initial_next_token: str = None) -> dict:
+        """
+        Fetch logs for a strategy
+
+        Args:
+            strategy_code: Strategy code
+            trading_type: Trading type
+            initial_next_token: Token of next logs for v4 logs
+
+        Returns:
+            Execution logs
+        """
+
+        return await self._send_request_with_key(strategy_code=strategy_code, trading_type=trading_type,
+                                                 build_request=lambda _key: {'method': 'post', 'endpoint': _EP_LOGS, 'params': _LOGS_PARAMS[trading_type], 'json_data': self.api._logs_json_data(key=_key, initial_next_token=initial_next_token)})
+
+    async def get_logs_all(self, strategy_code: str, trading_type: TradingType, initial_next_token: str = None):
+        """
+        Fetch all the logs available for a strategy, page by page, requesting the next page while the caller processes the current one
+
+        Args:
+            strategy_code: Strategy code
+            trading_type: Trading type
+            initial_next_token: Token of next logs for v4 logs
+
+        Yields:
+            Execution logs response for every page
+        """
+
+        task = asyncio.ensure_future(self.get_logs(strategy_code=strategy_code, trading_type=trading_type, initial_next_token=initial_next_token))
+        try:
+            while task is not None:
+                response = await task
+                if not response.get('data'):
+                    return
+
+                next_token = self.api._next_logs_token(response)
+                task = None
+                if next_token:
+                    task = asyncio.ensure_future(self.get_logs(strategy_code=strategy_code, trading_type=trading_type, initial_next_token=next_token))
+
+                yield response
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def get_reports(self, strategy_code: str, trading_type: TradingType, report_type: TradingReportType, country: str, current_page: int) -> dict:
+        """
+        Fetch report for a strategy
+
+        Args:
+            strategy_code: Strategy code
+            trading_type: Value of TradingType Enum
+            report_type: Value of TradingReportType Enum
+            country: Country of the exchange
+            current_page: current page of data being retrieved (for order history)
+
+        Returns:
+            Report data
+        """
+
+        await self._get_key(strategy_code=strategy_code, trading_type=trading_type)
+        endpoint, params = self.api._reports_request(strategy_code=strategy_code, trading_type=trading_type, report_type=report_type, country=country, current_page=current_page)
+        return await self._send_request(endpoint=endpoint, params=params)
+
+    async def get_reports_all(self, strategy_code: str, trading_type: TradingType, report_type: TradingReportType, country: str) -> list:
+        """
+        Fetch the complete report for a strategy, requesting all the pages of the order history concurrently
+
+        Args:
+            strategy_code: Strategy code
+            trading_type: Value of TradingType Enum
+            report_type: Value of TradingReportType Enum
+            country: Country of the exchange
+
+        Returns:
+            Report data of all the pages, merged into a single list
+        """
+
+        response = await self._get_reports_page(strategy_code=strategy_code, trading_type=trading_type, report_type=report_type, country=country, current_page=1)
+        pages = self.api._remaining_report_pages(report_type=report_type, first_response=response)
+        responses = await asyncio.gather(*(self._get_reports_page(strategy_code=strategy_code, trading_type=trading_type, report_type=report_type, country=country, current_page=page) for page in pages))
+
+        return _merge_report_pages([response, *responses])
+
+    async def _get_reports_page(self, strategy_code, trading_type, report_type, country, current_page):
+        # Same as `AlgoBullsAPI._get_reports_page`, waiting between attempts without blocking the event loop
+        for attempt in range(1, self.api.gateway_timeout_attempts + 1):
+            try:
+                return await self.get_reports(strategy_code=strategy_code, trading_type=trading_type, report_type=report_type, country=country, current_page=current_page)
+            except AlgoBullsAPIGatewayTimeoutErrorException:
+                if attempt == self.api.gateway_timeout_attempts:
+                    raise
+                self.api._report(f'Fetching page {current_page} of the report timed out (attempt {attempt}), retrying...', level=logging.WARNING)
+                await asyncio.sleep(self.api.gateway_timeout_retry_delay)
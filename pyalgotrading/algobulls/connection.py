@@ -26,10 +26,14 @@ class AlgoBullsConnection:
     Class for AlgoBulls connection
     """
 
-    def __init__(self):
+    def __init__(self, verbose=True):
         """
         Init method that is used while creating an object of this class
+
+        Args:
+            verbose: If True, progress messages of API calls (uploading strategies, submitting / stopping jobs, etc.) are printed. If False, they are sent to the `pyalgotrading.algobulls.api` logger instead.
         """
+        self.verbose = verbose
         self.api = AlgoBullsAPI(self)
 
         self.saved_parameters = {
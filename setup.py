@@ -160,10 +160,11 @@ setup(
     #
     # Similar to `install_requires` above, these must be valid existing
     # projects.
-    # extras_require={  # Optional
-    #     'dev': ['check-manifest'],
-    #     'test': ['coverage'],
-    # },
+    extras_require={  # Optional
+        'fast': ['orjson'],
+        'stream': ['ijson>=3.1'],
+        'http2': ['httpx[http2]'],
+    },
 
     # If there are data files included in your packages that need to be
     # installed, specify them here.
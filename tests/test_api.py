@@ -0,0 +1,414 @@
+import asyncio
+import json
+import math
+import os
+from concurrent.futures import Future
+from datetime import datetime as dt
+from types import SimpleNamespace
+
+import pytest
+
+from pyalgotrading.algobulls import api as api_module
+from pyalgotrading.algobulls.api import AlgoBullsAPI, AsyncAlgoBullsAPI, _json_loads
+from pyalgotrading.algobulls.exceptions import AlgoBullsAPIBaseException, AlgoBullsAPIGatewayTimeoutErrorException, AlgoBullsAPIResourceNotFoundErrorException, AlgoBullsAPIUnauthorizedErrorException
+from pyalgotrading.constants import TradingType, TradingReportType
+
+
+def _api_returning(body):
+    api = AlgoBullsAPI(None, strategy_key_cache_path=None)
+    content = json.dumps(body).encode()
+    api._request = lambda *args, **kwargs: SimpleNamespace(status_code=200, content=content, text=content.decode(), headers={})
+    return api
+
+
+@pytest.mark.parametrize('body, expected', [
+    ({'key': 'abc'}, 'abc'),
+    ({'key': 'abc', 'portfolio': {'value': 1}}, 'abc'),
+    ({'key': 5, 'portfolio': {'key': 'nested'}}, 5),
+    ({'key': None, 'x': {'key': 'nested'}}, None),
+    ({'portfolio': {'key': 'nested'}, 'key': 'top'}, 'top'),
+    ({'key': 'top', 'portfolio': {'key': 'nested'}}, 'top'),
+    ({'key': 'a"b'}, 'a"b'),
+    ({'x': {'key': 'nested'}}, None),
+])
+def test_send_request_field_returns_top_level_value(body, expected):
+    api = _api_returning(body)
+    assert api._send_request_field('key', method='post', endpoint='v2/portfolio/strategy') == expected
+
+
+def _api_counting_requests():
+    api = AlgoBullsAPI(None, strategy_key_cache_path=None)
+    api.calls = []
+
+    def send_request(method='get', endpoint='', **kwargs):
+        api.calls.append(endpoint)
+        return {'data': [endpoint]}
+
+    api._send_request = send_request
+    return api
+
+
+def test_get_strategy_details_refresh_only_drops_that_strategy():
+    api = _api_counting_requests()
+    api.get_strategy_details('a')
+    api.get_strategy_details('b')
+    api.get_strategy_details('a', refresh=True)
+    api.get_strategy_details('b')
+    assert len(api.calls) == 3
+
+
+def test_get_strategy_details_evicts_least_recently_used():
+    api = _api_counting_requests()
+    api.strategy_details_cache_size = 2
+    for strategy_code in ('a', 'b', 'a', 'c', 'a', 'b'):
+        api.get_strategy_details(strategy_code)
+    assert len(api.calls) == 4
+
+
+def test_cached_strategy_responses_are_not_shared_with_callers():
+    api = _api_counting_requests()
+    api.get_all_strategies()['data'].append('mutated')
+    api.get_strategy_details('a')['data'].append('mutated')
+    assert 'mutated' not in api.get_all_strategies()['data']
+    assert 'mutated' not in api.get_strategy_details('a')['data']
+    assert len(api.calls) == 2
+
+
+def test_set_strategy_config_without_key_does_not_raise_type_error():
+    api = AlgoBullsAPI(None, strategy_key_cache_path=None)
+    api._send_request_field = lambda *args, **kwargs: None
+    api._send_request = lambda **kwargs: {}
+    assert api.set_strategy_config(strategy_code='a', strategy_config={}, trading_type=TradingType.BACKTESTING) == (None, {})
+
+
+def test_api_verbosity_follows_connection():
+    from pyalgotrading.algobulls import AlgoBullsConnection
+    assert AlgoBullsConnection().api.verbose is True
+    assert AlgoBullsConnection(verbose=False).api.verbose is False
+
+
+@pytest.mark.parametrize('content, expected', [
+    (b'{"pnl": 1.5}', {'pnl': 1.5}),
+    (b'{"pnl": 123456789012345678901234567890}', {'pnl': 123456789012345678901234567890}),
+])
+def test_json_loads_accepts_what_the_standard_library_accepts(content, expected):
+    assert _json_loads(content) == expected
+
+
+def test_json_loads_accepts_nan():
+    assert math.isnan(_json_loads(b'{"pnl": NaN}')['pnl'])
+
+
+def _api_serving(*responses):
+    # Serve the given (status code, body, headers) responses in order and record the headers of each request
+    api = AlgoBullsAPI(None, strategy_key_cache_path=None)
+    api._send_request_field = lambda *args, **kwargs: 'key'
+    api.sent_headers = []
+    responses = list(responses)
+
+    def request(method, url, params=None, json_data=None, requires_authorization=True, headers=None):
+        api.sent_headers.append(headers)
+        status_code, body, response_headers = responses.pop(0)
+        content = b'' if body is None else json.dumps(body).encode()
+        return SimpleNamespace(status_code=status_code, content=content, text=content.decode(), headers=response_headers)
+
+    api._request = request
+    return api
+
+
+def test_get_job_status_within_poll_interval_is_not_sent():
+    api = _api_serving((200, {'message': 'STARTED'}, {'ETag': '"1"'}))
+    api.min_poll_interval = 60
+    assert api.get_job_status('a', TradingType.BACKTESTING) == {'message': 'STARTED'}
+    api.get_job_status('a', TradingType.BACKTESTING)['message'] = 'mutated'
+    assert api.get_job_status('a', TradingType.BACKTESTING) == {'message': 'STARTED'}
+    assert len(api.sent_headers) == 1
+
+
+def test_get_job_status_reuses_response_when_not_modified():
+    api = _api_serving((200, {'message': 'STARTED'}, {'ETag': '"1"'}), (304, None, {}))
+    api.min_poll_interval = 0
+    api.get_job_status('a', TradingType.BACKTESTING)
+    assert api.get_job_status('a', TradingType.BACKTESTING) == {'message': 'STARTED'}
+    assert api.sent_headers == [None, {'If-None-Match': '"1"'}]
+
+
+def test_not_modified_is_an_error_for_unconditional_requests():
+    api = _api_serving((304, None, {}))
+    with pytest.raises(AlgoBullsAPIBaseException):
+        api.get_all_strategies()
+
+
+@pytest.mark.parametrize('change_job', [
+    lambda api: api.start_strategy_algotrading('a', dt(2023, 1, 2), dt(2023, 1, 3), TradingType.BACKTESTING, lots=1, location='NSE'),
+    lambda api: api.stop_strategy_algotrading('a', TradingType.BACKTESTING),
+])
+def test_starting_or_stopping_a_job_drops_its_cached_status(change_job):
+    api = _api_serving((200, {'message': 'STOPPED'}, {'ETag': '"1"'}), (200, {}, {}), (200, {'message': 'STARTED'}, {'ETag': '"2"'}))
+    api.min_poll_interval = 60
+    api.get_job_status('a', TradingType.BACKTESTING)
+    change_job(api)
+    assert api.get_job_status('a', TradingType.BACKTESTING) == {'message': 'STARTED'}
+    assert api.sent_headers[-1] is None
+
+
+def test_set_access_token_drops_cached_statuses():
+    api = _api_serving((200, {'message': 'STARTED'}, {'ETag': '"1"'}), (200, {'message': 'STOPPED'}, {}))
+    api.min_poll_interval = 60
+    api.get_job_status('a', TradingType.BACKTESTING)
+    api.set_access_token('other')
+    assert api.get_job_status('a', TradingType.BACKTESTING) == {'message': 'STOPPED'}
+
+
+def _api_with_key_cache(path, access_token='token', keys=('k1', 'k2', 'k3'), rejected_keys=(), rejection=AlgoBullsAPIUnauthorizedErrorException):
+    # Fetching a key hands out the next one of `keys`; requests sent with one of `rejected_keys` fail with `rejection`
+    api = AlgoBullsAPI(None, strategy_key_cache_path=path)
+    api.fetched = []
+    keys = iter(keys)
+
+    def send_request_field(field, method='get', endpoint='', json_data=None, **kwargs):
+        api.fetched.append(json_data['strategyId'])
+        return next(keys)
+
+    def send_request(method='get', endpoint='', **kwargs):
+        if any(endpoint.endswith(f'/{key}?isPythonBuild=true') for key in rejected_keys):
+            raise rejection(method=method, url=endpoint, response={}, status_code=None)
+        return {}
+
+    api._send_request_field = send_request_field
+    api._send_request = send_request
+    api.set_access_token(access_token)
+    return api
+
+
+def _key_for(api, strategy_code='a', trading_type=TradingType.BACKTESTING):
+    key, _ = api.set_strategy_config(strategy_code=strategy_code, strategy_config={}, trading_type=trading_type)
+    return key
+
+
+def test_strategy_key_cache_is_read_on_set_access_token(tmp_path):
+    path = tmp_path / 'keycache.json'
+    api = AlgoBullsAPI(None, strategy_key_cache_path=str(path))
+    assert api._strategy_key_store is None
+    _key_for(_api_with_key_cache(str(path)))
+    api._send_request_field = lambda *args, **kwargs: pytest.fail('key should have been read from the cache')
+    api._send_request = lambda **kwargs: {}
+    api.set_access_token('token')
+    assert _key_for(api) == 'k1'
+
+
+def test_strategy_keys_are_reused_across_instances_of_the_same_user(tmp_path):
+    path = str(tmp_path / 'keycache.json')
+    assert _key_for(_api_with_key_cache(path)) == 'k1'
+    api = _api_with_key_cache(path, keys=('other',))
+    assert _key_for(api) == 'k1'
+    assert _key_for(api, trading_type=TradingType.PAPERTRADING) == 'other'
+    assert api.fetched == ['a']
+
+
+def test_strategy_keys_are_not_shared_between_access_tokens(tmp_path):
+    path = str(tmp_path / 'keycache.json')
+    _key_for(_api_with_key_cache(path))
+    assert _key_for(_api_with_key_cache(path, access_token='other', keys=('other',))) == 'other'
+    assert _key_for(_api_with_key_cache(path, keys=('unused',))) == 'k1'
+
+
+def test_expired_strategy_keys_are_fetched_again(tmp_path, monkeypatch):
+    path = str(tmp_path / 'keycache.json')
+    _key_for(_api_with_key_cache(path))
+    monkeypatch.setattr(AlgoBullsAPI, 'STRATEGY_KEY_CACHE_TTL', 0)
+    assert _key_for(_api_with_key_cache(path, keys=('fresh',))) == 'fresh'
+
+
+@pytest.mark.parametrize('rejection', [AlgoBullsAPIUnauthorizedErrorException, AlgoBullsAPIResourceNotFoundErrorException])
+def test_rejected_cached_key_is_evicted_and_request_retried(tmp_path, rejection):
+    path = str(tmp_path / 'keycache.json')
+    _key_for(_api_with_key_cache(path))
+    api = _api_with_key_cache(path, keys=('fresh',), rejected_keys=('k1',), rejection=rejection)
+    assert _key_for(api) == 'fresh'
+    assert _key_for(_api_with_key_cache(path, keys=('unused',))) == 'fresh'
+
+
+def test_rejected_fresh_key_is_not_retried(tmp_path):
+    api = _api_with_key_cache(str(tmp_path / 'keycache.json'), rejected_keys=('k1',))
+    with pytest.raises(AlgoBullsAPIUnauthorizedErrorException):
+        _key_for(api)
+    assert api.fetched == ['a']
+
+
+def test_failed_strategy_key_cache_write_keeps_previous_file(tmp_path, monkeypatch):
+    path = tmp_path / 'keycache.json'
+    _key_for(_api_with_key_cache(str(path)))
+    previous = path.read_bytes()
+
+    def replace(src, dst):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(os, 'replace', replace)
+    api = _api_with_key_cache(str(path), keys=('k2',))
+    assert _key_for(api, strategy_code='b') == 'k2'
+    assert path.read_bytes() == previous
+    assert os.listdir(tmp_path) == ['keycache.json']
+
+
+def test_prefetch_keys_persists_keys_fetched_before_a_failure(tmp_path):
+    path = str(tmp_path / 'keycache.json')
+    api = _api_with_key_cache(path)
+
+    def send_request_field(field, json_data=None, **kwargs):
+        if json_data['strategyId'] == 'b':
+            raise AlgoBullsAPIResourceNotFoundErrorException(method='patch', url='', response={}, status_code=404)
+        return 'k1'
+
+    api._send_request_field = send_request_field
+    with pytest.raises(AlgoBullsAPIResourceNotFoundErrorException):
+        api.prefetch_keys(['a', 'b'], TradingType.BACKTESTING)
+    assert _key_for(_api_with_key_cache(path, keys=('unused',))) == 'k1'
+
+
+def _api_with_order_history(total_trades, timeouts):
+    # Pages listed in `timeouts` time out at the gateway that many times before succeeding
+    api = AlgoBullsAPI(None, strategy_key_cache_path=None)
+    api.page_size = 2
+    api.gateway_timeout_retry_delay = 0
+    api.requested_pages = []
+    timeouts = dict(timeouts)
+
+    def get_reports(current_page, **kwargs):
+        api.requested_pages.append(current_page)
+        if timeouts.get(current_page):
+            timeouts[current_page] -= 1
+            raise AlgoBullsAPIGatewayTimeoutErrorException(method='get', url='', response='', status_code=504)
+        return {'totalTrades': total_trades, 'data': [current_page] * api.page_size}
+
+    api.get_reports = get_reports
+    return api
+
+
+def test_get_reports_all_retries_pages_timing_out_at_the_gateway():
+    api = _api_with_order_history(total_trades=6, timeouts={1: 1, 3: 4})
+    assert api.get_reports_all('a', TradingType.BACKTESTING, TradingReportType.ORDER_HISTORY, country='IN') == [1, 1, 2, 2, 3, 3]
+    assert sorted(api.requested_pages) == [1, 1, 2, 3, 3, 3, 3, 3]
+
+
+def test_get_reports_all_gives_up_after_the_last_attempt():
+    api = _api_with_order_history(total_trades=4, timeouts={2: 5})
+    with pytest.raises(AlgoBullsAPIGatewayTimeoutErrorException):
+        api.get_reports_all('a', TradingType.BACKTESTING, TradingReportType.ORDER_HISTORY, country='IN')
+    assert api.requested_pages.count(2) == 5
+
+
+def test_get_logs_all_cancels_prefetched_page_when_closed_early():
+    api = AlgoBullsAPI(None, strategy_key_cache_path=None)
+    api.page_size = 1
+    futures = []
+
+    def submit(fn, **kwargs):
+        # Only the first page completes; the prefetched ones are left pending
+        future = Future()
+        if not futures:
+            future.set_result({'data': ['log'], 'nextForwardToken': 'next'})
+        futures.append(future)
+        return future
+
+    api._executor = SimpleNamespace(submit=submit)
+    logs = api.get_logs_all('a', TradingType.BACKTESTING)
+    next(logs)
+    logs.close()
+    assert futures[1].cancelled()
+
+
+def _mock_transport(handler, async_client=False):
+    # An httpx client answering every request with `handler`, in place of the HTTP/2 connection to the platform
+    httpx = pytest.importorskip('httpx')
+    client_cls = httpx.AsyncClient if async_client else httpx.Client
+    return client_cls(base_url=AlgoBullsAPI.SERVER_ENDPOINT, transport=httpx.MockTransport(handler))
+
+
+def _responding(*responses):
+    # Handler replying with the given (status code, body) responses in order, recording every request
+    httpx = pytest.importorskip('httpx')
+    responses = list(responses)
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        status_code, body = responses.pop(0)
+        return httpx.Response(status_code, json=body)
+
+    return handler, requests
+
+
+@pytest.fixture
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(api_module, '_RETRY_DELAYS', (0,) * len(api_module._RETRY_DELAYS))
+
+
+def test_http2_backend_retries_gateway_errors(no_retry_delay):
+    handler, requests = _responding((502, {}), (503, {}), (200, {'data': []}))
+    api = AlgoBullsAPI(None, strategy_key_cache_path=None)
+    api._client = _mock_transport(handler)
+    api.set_access_token('token')
+    assert api.get_all_strategies() == {'data': []}
+    assert len(requests) == 3
+    assert requests[-1].headers['Authorization'] == 'token'
+
+
+def test_http2_backend_does_not_retry_non_idempotent_requests(no_retry_delay):
+    handler, requests = _responding((503, {}))
+    api = AlgoBullsAPI(None, strategy_key_cache_path=None)
+    api._client = _mock_transport(handler)
+    with pytest.raises(AlgoBullsAPIBaseException):
+        api._send_request(method='post', endpoint='v2/portfolio/strategy')
+    assert len(requests) == 1
+
+
+def _async_api(handler, page_size=2):
+    api = AlgoBullsAPI(None, strategy_key_cache_path=None)
+    api.page_size = page_size
+    api.gateway_timeout_retry_delay = 0
+    for cache in api._tt_cache.values():
+        cache['a'] = 'key'
+    async_api = AsyncAlgoBullsAPI(api)
+    async_api._client = _mock_transport(handler, async_client=True)
+    return async_api
+
+
+def test_async_get_reports_all_merges_all_pages(no_retry_delay):
+    httpx = pytest.importorskip('httpx')
+    failures = {'2': [502], '3': [504]}
+    pages = []
+
+    def handler(request):
+        page = request.url.params['currentPage']
+        pages.append(page)
+        if failures.get(page):
+            return httpx.Response(failures[page].pop(), json={})
+        return httpx.Response(200, json={'totalTrades': 5, 'data': [int(page)] * 2})
+
+    async_api = _async_api(handler)
+    data = asyncio.run(async_api.get_reports_all('a', TradingType.BACKTESTING, TradingReportType.ORDER_HISTORY, country='IN'))
+    assert data == [1, 1, 2, 2, 3, 3]
+    assert sorted(pages) == ['1', '2', '2', '3', '3']
+
+
+def test_async_get_logs_all_follows_next_token():
+    handler, requests = _responding((200, {'data': ['a'], 'nextForwardToken': 't1'}), (200, {'data': ['b'], 'nextForwardToken': 't2'}), (200, {'data': []}))
+    async_api = _async_api(handler, page_size=1)
+
+    async def collect():
+        return [response['data'] async for response in async_api.get_logs_all('a', TradingType.BACKTESTING)]
+
+    assert asyncio.run(collect()) == [['a'], ['b']]
+    assert [json.loads(request.content)['nextForwardToken'] for request in requests][1:] == ['t1', 't2']
+
+
+def test_async_stale_cached_key_is_evicted_and_request_retried(tmp_path):
+    handler, requests = _responding((401, {}), (200, {'data': []}))
+    path = str(tmp_path / 'keycache.json')
+    _key_for(_api_with_key_cache(path))
+    api = _api_with_key_cache(path, keys=('fresh',))
+    async_api = AsyncAlgoBullsAPI(api)
+    async_api._client = _mock_transport(handler, async_client=True)
+    assert asyncio.run(async_api.get_logs('a', TradingType.BACKTESTING)) == {'data': []}
+    assert [json.loads(request.content)['key'] for request in requests] == ['k1', 'fresh']